@@ -1,118 +1,511 @@
 import streamlit as st
-from langchain_openai import ChatOpenAI
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.runnables import RunnablePassthrough
-from dotenv import load_dotenv
+import orjson
+from tenacity import Retrying, RetryCallState, retry_if_exception_type, stop_after_attempt, wait_exponential
 import os
 import logging
-from typing import Optional, Dict, Union
-import json
+from typing import TYPE_CHECKING, Callable, Iterator, Optional, Dict, List, Sequence, Tuple, Union
+from typing_extensions import Annotated, TypedDict
+import random
+import sqlite3
+import threading
+import time
 from datetime import datetime
+from types import MappingProxyType
+
+# LangChain and the OpenAI SDK are imported on first use: they are slow to import
+# and most reruns (browsing the gallery or tips) never touch them
+if TYPE_CHECKING:
+    from openai import DefaultHttpxClient
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Load environment variables once per process, skipping the .env file when the key is already set
+if not os.getenv("OPENAI_API_KEY"):
+    from dotenv import load_dotenv
+    load_dotenv()
+
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+
+# Where deterministic-mode responses are cached, e.g. on a persistent volume
+LLM_CACHE_PATH = os.getenv("PETNAME_CACHE_DB", ".petname_cache.db")
+
+# A small model is plenty for a four-field name suggestion and answers much faster;
+# the larger ones are offered under "Advanced" for users who prefer quality.
+# The token cap stops long-winded explanations from dragging out the response;
+# every field in PetName is bounded so a complete answer fits well within it.
+DEFAULT_MODEL = "gpt-4o-mini"
+MODEL_OPTIONS = ("gpt-4o-mini", "gpt-4o")
+MAX_TOKENS = 150
+
+# Seconds before a hung request is abandoned and retried
+REQUEST_TIMEOUT = 15
+
+# Attempts per request when OpenAI reports a transient error
+RETRY_ATTEMPTS = 5
+
+# Upper bound for the "Number of suggestions" slider; all of them are requested in parallel
+MAX_SUGGESTIONS = 8
+
+# Names generated offline by precompute_names.py for the dropdown combinations
+PRECOMPUTED_PATH = "precomputed.json"
+
+# Favorites are persisted here so they survive restarts and new browser sessions
+FAVORITES_DB_PATH = "favorites.db"
+
+# Everything static lives in the system message and the pet details come last,
+# so every request shares a byte-identical prefix that OpenAI's automatic
+# prompt caching can reuse.
+SYSTEM_PROMPT = "Suggest a creative, easy-to-call pet name that suits the pet's color, type and gender."
+HUMAN_PROMPT = "Pet details: {pet_color} {animal_type}, {gender}. Personality: {personality}. Name style: {name_style}"
+
+class PetName(TypedDict):
+    """A name suggestion for a pet."""
+
+    name: Annotated[str, ..., "The name, one or two words"]
+    explanation: Annotated[str, ..., "Why it fits, in one short sentence"]
+    fun_fact: Annotated[str, ..., "A fun fact about the name, in one short sentence"]
+    nickname: Annotated[str, ..., "A nickname, one word"]
+
+# Spelling variants mapped to the word used by the dropdowns
+WORD_VARIANTS = {
+    "grey": "gray",
+    "gold": "golden",
+    "colour": "color",
+    "multicolor": "multi-colored",
+    "multicolored": "multi-colored",
+    "multicolour": "multi-colored",
+    "multicoloured": "multi-colored",
+    "multi-coloured": "multi-colored",
+    "guinea-pig": "guinea pig",
+}
+
+def _canonicalize(text: str) -> str:
+    return " ".join(WORD_VARIANTS.get(word, word) for word in text.lower().split())
+
+def _transient_errors() -> tuple:
+    from openai import APIConnectionError, InternalServerError, RateLimitError
+
+    # Errors worth retrying; APITimeoutError is a subclass of APIConnectionError.
+    # Other APIErrors (bad request, auth) would fail the same way again.
+    return (RateLimitError, APIConnectionError, InternalServerError)
+
+def _enable_llm_cache():
+    from langchain_core.globals import get_llm_cache, set_llm_cache
+
+    # Identical prompts are answered from disk instead of the OpenAI API.
+    # Only generators created in deterministic mode opt in to this cache.
+    if get_llm_cache() is None:
+        from langchain_community.cache import SQLiteCache
+        set_llm_cache(SQLiteCache(database_path=LLM_CACHE_PATH))
+
+def _log_retry(retry_state: RetryCallState):
+    logger.warning(f"Attempt {retry_state.attempt_number} failed: {str(retry_state.outcome.exception())}")
+
 class PetNameGenerator:
-    def __init__(self, temperature: float = 0.7):
-        load_dotenv()
-        
-        if not os.getenv("OPENAI_API_KEY"):
+    # The prompt has no per-instance state, so it is parsed once per process
+    _PROMPT = None
+
+    @classmethod
+    def _prompt(cls):
+        if cls._PROMPT is None:
+            from langchain_core.prompts import ChatPromptTemplate
+            cls._PROMPT = ChatPromptTemplate.from_messages([
+                ("system", SYSTEM_PROMPT),
+                ("human", HUMAN_PROMPT)
+            ])
+        return cls._PROMPT
+
+    def __init__(
+        self,
+        temperature: float = 0.7,
+        deterministic: bool = False,
+        http_client: Optional["DefaultHttpxClient"] = None,
+        model: str = DEFAULT_MODEL
+    ):
+        if not OPENAI_API_KEY:
             raise ValueError("OPENAI_API_KEY not found in environment variables")
         
-        self.llm = ChatOpenAI(temperature=temperature)
+        from langchain_core.runnables import RunnableLambda, RunnablePassthrough
+        from langchain_openai import ChatOpenAI
         
-        self.prompt_template = ChatPromptTemplate.from_template(
-            """I need a creative and fitting name for my {pet_color} {animal_type} who is {gender}.
-            Consider these aspects:
-            - The animal's color, type, and gender
-            - Cultural references that might be fun
-            - How the name sounds when called out
-            - Any relevant mythology or history
-            - Current pop culture references if applicable
-            - Names that are appropriate for the specified gender
-            
-            Please respond with the following format, separated by |:
-            1. The name (appropriate for a {gender} pet)
-            2. A brief explanation of why you chose it
-            3. A fun fact related to the name
-            4. A suggested nickname
-            
-            For example: "Luna | This name reflects both the cat's mysterious nature and silver-gray color | Luna is the Roman goddess of the moon | Suggested nickname: Lunie"""
+        if deterministic:
+            _enable_llm_cache()
+        self.transient_errors = _transient_errors()
+        
+        # Deterministic mode pins the seed so a cached answer matches what a
+        # fresh call would return; otherwise every click asks for a new name
+        self.deterministic = deterministic
+        self.llm = ChatOpenAI(
+            api_key=OPENAI_API_KEY,
+            model=model,
+            temperature=temperature,
+            max_tokens=MAX_TOKENS,
+            timeout=REQUEST_TIMEOUT,
+            seed=42 if deterministic else None,
+            cache=deterministic,
+            http_client=http_client,
+            # Retries are handled here with backoff; don't let the SDK retry underneath
+            max_retries=0
         )
         
-        self.chain = RunnablePassthrough() | self.prompt_template | self.llm
+        self.prompt_template = self._prompt()
+        
+        # OpenAI's strict JSON-schema mode guarantees all four fields come back,
+        # so there is no free-text parsing left to fail and burn a retry
+        self.chain = (
+            RunnablePassthrough()
+            | self.prompt_template
+            | self.llm.with_structured_output(PetName, method="json_schema", strict=True)
+        )
+        # Wrapping the retrying call lets batch fan it out, so batched candidates
+        # back off and log exactly like a single name does
+        self.generate_runnable = RunnableLambda(self._generate)
+
+    @staticmethod
+    def _prepare_input(
+        animal_type: str,
+        pet_color: str,
+        gender: str,
+        personality_traits: Sequence[str] = (),
+        name_style: str = "Any"
+    ) -> Dict[str, str]:
+        # Validate inputs
+        if not all(x.strip() for x in [animal_type, pet_color, gender]):
+            raise ValueError("Animal type, color, and gender cannot be empty")
+        
+        # Clean inputs; spelling variants are canonicalised so near-duplicate
+        # free-text entries produce the same prompt and hit the response cache
+        return {
+            "pet_color": _canonicalize(pet_color),
+            "animal_type": _canonicalize(animal_type),
+            "gender": gender.lower().strip(),
+            "personality": ", ".join(trait.lower() for trait in personality_traits) or "any",
+            "name_style": name_style.lower()
+        }
+
+    @staticmethod
+    def _parse_response(pet_name: Optional[PetName], gender: str) -> Dict[str, Union[str, Optional[str]]]:
+        # A stream cut short (e.g. by max_tokens) can leave trailing fields unset;
+        # a usable name is still worth showing, so only a missing name is an error
+        if not pet_name or not pet_name.get("name", "").strip():
+            raise ValueError("The model did not return a name")
+        
+        return {
+            "name": pet_name["name"].strip(),
+            "explanation": pet_name.get("explanation", "").strip(),
+            "fun_fact": pet_name.get("fun_fact", "").strip(),
+            "nickname": pet_name.get("nickname", "").strip(),
+            "gender": gender,
+            "error": None
+        }
+
+    @staticmethod
+    def _error_result(error: Exception) -> Dict[str, Union[str, Optional[str]]]:
+        error_msg = f"Failed to generate name: {str(error)}"
+        logger.error(error_msg)
+        return {
+            "name": None,
+            "explanation": None,
+            "fun_fact": None,
+            "nickname": None,
+            "gender": None,
+            "error": error_msg
+        }
+
+    def _stream(self, input_data: Dict[str, str]) -> Iterator[PetName]:
+        # The response cache is only consulted by invoke, never by stream, so
+        # deterministic generators hand back the whole answer in one piece
+        if self.deterministic:
+            yield self.chain.invoke(input_data)
+            return
+        
+        # Each chunk is the answer so far, with its fields partially filled in
+        yield from self.chain.stream(input_data)
+
+    def _generate(
+        self,
+        input_data: Dict[str, str],
+        retries: int = RETRY_ATTEMPTS,
+        on_partial: Optional[Callable[[Dict[str, str]], None]] = None
+    ) -> Optional[PetName]:
+        pet_name = None
+        try:
+            # Only transient API errors are retried, with exponential backoff;
+            # parse failures are not going to fix themselves on another call
+            for attempt in Retrying(
+                stop=stop_after_attempt(retries),
+                wait=wait_exponential(multiplier=1, min=1, max=30),
+                retry=retry_if_exception_type(self.transient_errors),
+                before_sleep=_log_retry,
+                reraise=True
+            ):
+                with attempt:
+                    # Hand partial answers to the caller as they arrive; the result
+                    # is only built once the stream is complete
+                    pet_name = None
+                    for pet_name in self._stream(input_data):
+                        if on_partial and pet_name:
+                            on_partial(pet_name)
+        except Exception as e:
+            # A stream that fails once the name is in, e.g. when max_tokens cuts
+            # it off, still leaves a usable answer
+            if not pet_name or not pet_name.get("name", "").strip():
+                raise
+            logger.warning(f"Keeping partial answer after error: {str(e)}")
+        return pet_name
 
     def generate_name(
         self, 
         animal_type: str, 
         pet_color: str, 
         gender: str,
-        retries: int = 3
+        personality_traits: Sequence[str] = (),
+        name_style: str = "Any",
+        retries: int = RETRY_ATTEMPTS,
+        on_partial: Optional[Callable[[Dict[str, str]], None]] = None
     ) -> Dict[str, Union[str, Optional[str]]]:
         try:
-            # Validate inputs
-            if not all(x.strip() for x in [animal_type, pet_color, gender]):
-                raise ValueError("Animal type, color, and gender cannot be empty")
-            
-            # Clean inputs
-            animal_type = animal_type.lower().strip()
-            pet_color = pet_color.lower().strip()
-            gender = gender.lower().strip()
+            input_data = self._prepare_input(animal_type, pet_color, gender, personality_traits, name_style)
             
-            logger.info(f"Generating name for {gender} {pet_color} {animal_type}")
+            logger.info(f"Generating name for {input_data['gender']} {input_data['pet_color']} {input_data['animal_type']}")
             
-            input_data = {
-                "pet_color": pet_color,
-                "animal_type": animal_type,
-                "gender": gender
-            }
-            
-            for attempt in range(retries):
-                try:
-                    response = self.chain.invoke(input_data)
-                    name, explanation, fun_fact, nickname = response.content.strip().split("|")
-                    return {
-                        "name": name.strip(),
-                        "explanation": explanation.strip(),
-                        "fun_fact": fun_fact.strip(),
-                        "nickname": nickname.strip(),
-                        "gender": gender,
-                        "error": None
-                    }
-                except Exception as e:
-                    logger.warning(f"Attempt {attempt + 1} failed: {str(e)}")
-                    if attempt == retries - 1:
-                        raise
+            pet_name = self._generate(input_data, retries, on_partial)
+            return self._parse_response(pet_name, input_data["gender"])
             
         except Exception as e:
-            error_msg = f"Failed to generate name: {str(e)}"
-            logger.error(error_msg)
-            return {
-                "name": None,
-                "explanation": None,
-                "fun_fact": None,
-                "nickname": None,
-                "gender": None,
-                "error": error_msg
-            }
-
-def load_favorites():
-    try:
-        return json.loads(st.session_state.get('favorites', '[]'))
-    except:
-        return []
+            return self._error_result(e)
 
-def save_favorites(favorites):
-    st.session_state['favorites'] = json.dumps(favorites)
+    def generate_many(
+        self,
+        animal_type: str,
+        pet_color: str,
+        gender: str,
+        personality_traits: Sequence[str] = (),
+        name_style: str = "Any",
+        count: int = 5,
+        max_concurrency: Optional[int] = None
+    ) -> List[Dict[str, Union[str, Optional[str]]]]:
+        try:
+            input_data = self._prepare_input(animal_type, pet_color, gender, personality_traits, name_style)
+        except ValueError as e:
+            return [self._error_result(e)]
+        
+        # Identical prompts with a pinned seed all come back with the same name,
+        # so a deterministic generator only pays for one of them
+        if self.deterministic:
+            count = 1
+        
+        logger.info(f"Generating {count} names for {input_data['gender']} {input_data['pet_color']} {input_data['animal_type']}")
+        
+        return self._batch([input_data] * count, max_concurrency)
+
+    def generate_batch(
+        self,
+        pets: List[Tuple[str, str, str]],
+        max_concurrency: Optional[int] = None
+    ) -> List[Dict[str, Union[str, Optional[str]]]]:
+        # One name per (animal_type, pet_color, gender) entry, all in a single batch.
+        # Invalid entries get their own error result so the output lines up with pets.
+        inputs = []
+        results = []
+        for pet in pets:
+            try:
+                inputs.append(self._prepare_input(*pet))
+                results.append(None)
+            except ValueError as e:
+                results.append(self._error_result(e))
+        
+        logger.info(f"Generating {len(inputs)} names in one batch")
+        
+        generated = iter(self._batch(inputs, max_concurrency) if inputs else [])
+        return [result or next(generated) for result in results]
+
+    def _batch(
+        self,
+        inputs: List[Dict[str, str]],
+        max_concurrency: Optional[int] = None
+    ) -> List[Dict[str, Union[str, Optional[str]]]]:
+        # batch runs the calls on a thread pool over one HTTP connection pool, so all
+        # candidates are in flight at once; pass max_concurrency to respect tighter rate limits
+        responses = self.generate_runnable.batch(
+            inputs,
+            config={"max_concurrency": max_concurrency or len(inputs)},
+            return_exceptions=True
+        )
+        
+        results = []
+        for response, input_data in zip(responses, inputs):
+            try:
+                if isinstance(response, Exception):
+                    raise response
+                results.append(self._parse_response(response, input_data["gender"]))
+            except Exception as e:
+                results.append(self._error_result(e))
+        return results
+
+@st.cache_resource
+def get_http_client() -> "DefaultHttpxClient":
+    import httpx
+    from openai import DefaultHttpxClient
+
+    # One connection pool for every generator, so moving the creativity slider
+    # doesn't pay a fresh TCP/TLS handshake to the OpenAI API. Idle connections
+    # are kept for a minute so clicks a little while apart still find them warm.
+    return DefaultHttpxClient(
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=20,
+            keepalive_expiry=60
+        )
+    )
+
+@st.cache_resource
+def get_generator(
+    temperature: float,
+    deterministic: bool = False,
+    model: str = DEFAULT_MODEL
+) -> PetNameGenerator:
+    return PetNameGenerator(
+        temperature=temperature,
+        deterministic=deterministic,
+        http_client=get_http_client(),
+        model=model
+    )
+
+def precomputed_key(animal_type: str, pet_color: str, gender: str) -> str:
+    return "|".join(_canonicalize(x) for x in [animal_type, pet_color, gender])
+
+@st.cache_resource
+def load_precomputed() -> Dict[str, List[Dict]]:
+    try:
+        with open(PRECOMPUTED_PATH, "rb") as f:
+            return orjson.loads(f.read())
+    except FileNotFoundError:
+        return {}
+
+def quick_pick(
+    animal_type: str,
+    pet_color: str,
+    gender: str,
+    count: int = 1,
+    deterministic: bool = False
+) -> Optional[List[Dict]]:
+    options = load_precomputed().get(precomputed_key(animal_type, pet_color, gender), [])
+    if len(options) < count:
+        return None
+    picks = options[:count] if deterministic else random.sample(options, count)
+    # Copy so callers can annotate results without touching the shared table
+    return [dict(pick) for pick in picks]
+
+# Static UI content, built once per process instead of on every rerun and
+# read-only so no rerun can accidentally mutate what every session shares
+PET_TYPES = MappingProxyType({
+    "Cat": "🐱", "Dog": "🐶", "Bird": "🦜", "Fish": "🐠",
+    "Hamster": "🐹", "Rabbit": "🐰", "Snake": "🐍",
+    "Lizard": "🦎", "Parrot": "🦜", "Guinea Pig": "🐹",
+    "Other": "✨"
+})
+
+PET_COLORS = (
+    "Black", "White", "Brown", "Golden", "Gray", "Orange",
+    "Spotted", "Striped", "Multi-colored", "Other"
+)
+
+PET_TYPES_OPTIONS = tuple(PET_TYPES)
+
+GENDERS = ("Female", "Male")
+
+PERSONALITY_TRAITS = ("Playful", "Shy", "Energetic", "Calm", "Clever", "Friendly", "Mysterious", "Regal")
+
+NAME_STYLES = ("Any", "Classic", "Modern", "Mythological", "Pop Culture", "Nature-inspired")
+
+PAGE_CSS = """
+<style>
+.pet-name {
+    font-size: 2.5em;
+    font-weight: bold;
+    color: #1E88E5;
+    text-align: center;
+    padding: 20px;
+}
+.highlight {
+    background-color: #000000;
+    padding: 20px;
+    border-radius: 10px;
+    margin: 10px 0;
+}
+.stButton > button {
+    width: 100%;
+}
+</style>
+"""
+
+TIPS_GREAT_NAME = """
+* **Easy to pronounce:** Your pet should recognize their name easily
+* **Distinct sound:** Choose a name that stands out from common commands
+* **Length:** 1-2 syllables are ideal for most pets
+* **Positive associations:** Pick a name you'll be happy to use for years
+* **Gender appropriate:** Consider names that match your pet's gender
+* **Unique but not too complex:** Be creative while keeping it practical
+"""
+
+TIPS_MISTAKES = """
+* Choosing names too similar to commands
+* Picking overly long or complicated names
+* Using names that could be embarrassing to call in public
+* Selecting names your pet can't distinguish
+* Picking trendy names that might age poorly
+* Using names that don't match your pet's gender
+"""
+
+TIPS_GENERATOR = """
+* Try different creativity levels for varied suggestions
+* Use personality traits to get more tailored names
+* Save your favorites to compare later
+* Generate multiple options before deciding
+* Consider both the main name and nickname
+* Think about how the name suits your pet's gender
+"""
+
+@st.cache_resource
+def get_db() -> sqlite3.Connection:
+    connection = sqlite3.connect(FAVORITES_DB_PATH, check_same_thread=False)
+    connection.execute("CREATE TABLE IF NOT EXISTS favorites (id INTEGER PRIMARY KEY, data TEXT NOT NULL)")
+    connection.commit()
+    return connection
+
+# Every session runs on its own thread but they all share the one connection
+@st.cache_resource
+def get_db_lock() -> threading.Lock:
+    return threading.Lock()
+
+# Favorites are shared by every session, so one process-wide cache is correct;
+# it is cleared whenever a favorite is added or removed
+@st.cache_data
+def load_favorites() -> List[Dict]:
+    with get_db_lock():
+        rows = get_db().execute("SELECT id, data FROM favorites ORDER BY id").fetchall()
+    return [{**orjson.loads(data), "id": favorite_id} for favorite_id, data in rows]
+
+def add_favorite(result: Dict):
+    with get_db_lock(), get_db() as connection:
+        connection.execute("INSERT INTO favorites (data) VALUES (?)", (orjson.dumps(result).decode(),))
+    load_favorites.clear()
+
+def remove_favorite(favorite_id: int):
+    with get_db_lock(), get_db() as connection:
+        connection.execute("DELETE FROM favorites WHERE id = ?", (favorite_id,))
+    load_favorites.clear()
 
 def initialize_session_state():
     if 'name_history' not in st.session_state:
         st.session_state.name_history = []
     if 'generation_count' not in st.session_state:
         st.session_state.generation_count = 0
-    if 'favorites' not in st.session_state:
-        st.session_state.favorites = '[]'
+    if 'last_results' not in st.session_state:
+        st.session_state.last_results = []
 
 def setup_page_config():
     st.set_page_config(
@@ -121,28 +514,11 @@ def setup_page_config():
         layout="wide"
     )
     
-    st.markdown("""
-        <style>
-        .pet-name {
-            font-size: 2.5em;
-            font-weight: bold;
-            color: #1E88E5;
-            text-align: center;
-            padding: 20px;
-        }
-        .highlight {
-            background-color: #000000;
-            padding: 20px;
-            border-radius: 10px;
-            margin: 10px 0;
-        }
-        .stButton > button {
-            width: 100%;
-        }
-        </style>
-    """, unsafe_allow_html=True)
+    # Streamlit only keeps elements emitted during the current run, so the
+    # styles are re-sent every rerun; the string itself is built once
+    st.markdown(PAGE_CSS, unsafe_allow_html=True)
 
-def display_name_result(result, pet_color, animal_type, gender):
+def display_name_result(result, pet_color, animal_type, gender, key=0):
     st.markdown(f"<div class='pet-name'>{result['name']}</div>", unsafe_allow_html=True)
     
     info_col1, info_col2, info_col3 = st.columns(3)
@@ -159,37 +535,40 @@ def display_name_result(result, pet_color, animal_type, gender):
         st.markdown("### 💝 Nickname")
         st.markdown(f"<div class='highlight'>{result['nickname']}</div>", unsafe_allow_html=True)
 
-    if st.button("❤️ Save to Favorites"):
-        favorites = load_favorites()
-        favorites.append(result)
-        save_favorites(favorites)
-        st.success("Added to your favorites!")
+    if st.button("❤️ Save to Favorites", key=f"save_{key}"):
+        add_favorite(result)
+        # A toast survives the rerun that brings the gallery up to date
+        st.toast("Added to the shared favorites!")
+        st.rerun()
 
     st.markdown("---")
     st.markdown("### 📱 Share this name")
     share_text = f"Just found the perfect name for my {gender.lower()} {pet_color.lower()} {animal_type.lower()}: {result['name']}! Generated by the Perfect Pet Name Generator 🐾"
     st.code(share_text, language=None)
-    st.button("📋 Copy to Clipboard")
+    st.button("📋 Copy to Clipboard", key=f"copy_{key}")
 
-def display_favorites():
-    favorites = load_favorites()
+def display_partial_name(placeholder, partial):
+    placeholder.markdown(f"<div class='pet-name'>{partial.get('name', '')}</div>", unsafe_allow_html=True)
+
+def display_favorites(favorites):
     if favorites:
-        st.subheader("❤️ Your Favorite Names")
+        st.subheader("❤️ Shared Favorite Names")
+        st.caption("Favorites are shared by everyone using this app.")
         for fav in favorites:
             with st.expander(f"{fav['name']} - {fav['gender']} {fav['animal_type']}"):
                 st.write(f"**Explanation:** {fav['explanation']}")
                 st.write(f"**Fun Fact:** {fav['fun_fact']}")
                 st.write(f"**Nickname:** {fav['nickname']}")
-                if st.button("Remove from Favorites", key=f"remove_{fav['name']}"):
-                    favorites.remove(fav)
-                    save_favorites(favorites)
+                if st.button("Remove from Favorites", key=f"remove_{fav['id']}"):
+                    remove_favorite(fav['id'])
                     st.rerun()
 
 def display_name_history():
     if st.session_state.name_history:
         st.subheader("📜 Recently Generated Names")
         for item in reversed(st.session_state.name_history[-5:]):
-            with st.expander(f"{item['name']} - {item['timestamp']}"):
+            timestamp = datetime.fromtimestamp(item['timestamp_ns'] / 1e9).strftime("%Y-%m-%d %H:%M:%S")
+            with st.expander(f"{item['name']} - {timestamp}"):
                 st.write(f"**For:** {item['gender']} {item['pet_color']} {item['animal_type']}")
                 st.write(f"**Explanation:** {item['explanation']}")
                 st.write(f"**Fun Fact:** {item['fun_fact']}")
@@ -199,85 +578,49 @@ def display_tips():
     st.header("🌟 Tips & Tricks for Choosing the Perfect Pet Name")
     
     with st.expander("🎯 What Makes a Great Pet Name"):
-        st.markdown("""
-        * **Easy to pronounce:** Your pet should recognize their name easily
-        * **Distinct sound:** Choose a name that stands out from common commands
-        * **Length:** 1-2 syllables are ideal for most pets
-        * **Positive associations:** Pick a name you'll be happy to use for years
-        * **Gender appropriate:** Consider names that match your pet's gender
-        * **Unique but not too complex:** Be creative while keeping it practical
-        """)
+        st.markdown(TIPS_GREAT_NAME)
         
     with st.expander("🚫 Common Naming Mistakes to Avoid"):
-        st.markdown("""
-        * Choosing names too similar to commands
-        * Picking overly long or complicated names
-        * Using names that could be embarrassing to call in public
-        * Selecting names your pet can't distinguish
-        * Picking trendy names that might age poorly
-        * Using names that don't match your pet's gender
-        """)
+        st.markdown(TIPS_MISTAKES)
         
     with st.expander("💡 Pro Tips for Using the Generator"):
-        st.markdown("""
-        * Try different creativity levels for varied suggestions
-        * Use personality traits to get more tailored names
-        * Save your favorites to compare later
-        * Generate multiple options before deciding
-        * Consider both the main name and nickname
-        * Think about how the name suits your pet's gender
-        """)
-
-def main():
-    setup_page_config()
-    initialize_session_state()
-
-    st.title("🐾 Perfect Pet Name Generator")
-    st.markdown("*Creating unique and meaningful names for your furry friends!*")
-
-    tab1, tab2, tab3 = st.tabs(["Generate Name", "Name Gallery", "Tips & Tricks"])
-
-    with tab1:
-        col1, col2, col3 = st.columns(3)
-
-        pet_types = {
-            "Cat": "🐱", "Dog": "🐶", "Bird": "🦜", "Fish": "🐠",
-            "Hamster": "🐹", "Rabbit": "🐰", "Snake": "🐍",
-            "Lizard": "🦎", "Parrot": "🦜", "Guinea Pig": "🐹",
-            "Other": "✨"
-        }
-
-        pet_colors = [
-            "Black", "White", "Brown", "Golden", "Gray", "Orange",
-            "Spotted", "Striped", "Multi-colored", "Other"
-        ]
-
-        with col1:
-            animal_type = st.selectbox(
-                "What kind of pet do you have?",
-                options=list(pet_types.keys()),
-                format_func=lambda x: f"{pet_types[x]} {x}"
-            )
-            if animal_type == "Other":
-                animal_type = st.text_input("Enter your pet type:")
-
-        with col2:
-            pet_color = st.selectbox(
-                "What color is your pet?",
-                pet_colors
-            )
-            if pet_color == "Other":
-                pet_color = st.text_input("Enter your pet's color:")
+        st.markdown(TIPS_GENERATOR)
+
+# Fragments rerun on their own when one of their widgets changes, so choosing a
+# pet type or typing a custom color doesn't rerun the other tabs and the footer
+@st.fragment
+def display_generator(model):
+    col1, col2 = st.columns(2)
+
+    with col1:
+        animal_type = st.selectbox(
+            "What kind of pet do you have?",
+            options=PET_TYPES_OPTIONS,
+            format_func=lambda x: f"{PET_TYPES[x]} {x}"
+        )
+        if animal_type == "Other":
+            animal_type = st.text_input("Enter your pet type:")
 
-        with col3:
-            gender = st.selectbox(
-                "What's your pet's gender?",
-                ["Female", "Male"]
-            )
+    with col2:
+        pet_color = st.selectbox(
+            "What color is your pet?",
+            PET_COLORS
+        )
+        if pet_color == "Other":
+            pet_color = st.text_input("Enter your pet's color:")
+
+    # Everything below the pet type and color sits in a form, so adjusting these
+    # widgets doesn't trigger a rerun until the form is submitted.
+    # Type and color stay outside because picking "Other" reveals a text input.
+    with st.form("generate_form"):
+        gender = st.selectbox(
+            "What's your pet's gender?",
+            GENDERS
+        )
 
         personality_traits = st.multiselect(
             "Select your pet's personality traits (optional)",
-            ["Playful", "Shy", "Energetic", "Calm", "Clever", "Friendly", "Mysterious", "Regal"]
+            PERSONALITY_TRAITS
         )
 
         col4, col5 = st.columns(2)
@@ -290,51 +633,128 @@ def main():
                 step=0.1,
                 help="Higher values will generate more creative and varied names"
             )
-        
+
         with col5:
             name_style = st.selectbox(
                 "Name Style Preference",
-                ["Any", "Classic", "Modern", "Mythological", "Pop Culture", "Nature-inspired"]
+                NAME_STYLES
             )
 
-        if st.button("✨ Generate Perfect Name ✨", type="primary"):
-            if all([animal_type, pet_color, gender]):
-                with st.spinner("Creating the perfect name for your pet..."):
-                    try:
-                        generator = PetNameGenerator(temperature=temperature)
-                        result = generator.generate_name(animal_type, pet_color, gender)
+        num_suggestions = st.slider(
+            "Number of suggestions",
+            min_value=1,
+            max_value=MAX_SUGGESTIONS,
+            value=1,
+            help="Generate several names at once to compare"
+        )
 
-                        if result["name"]:
+        deterministic = st.checkbox(
+            "Deterministic mode",
+            help="Always suggest the same name for the same pet. Repeat requests are served from a local cache, and only one name is generated per request."
+        )
+
+        submitted = st.form_submit_button("✨ Generate Perfect Name ✨", type="primary", use_container_width=True)
+
+    if submitted:
+        if all([animal_type, pet_color, gender]):
+            # Cleared up front so a failure below isn't followed by a rerun that
+            # hides its error behind the previous click's names
+            st.session_state.last_results = []
+            with st.spinner("Creating the perfect name for your pet..."):
+                try:
+                    # Plain dropdown combinations are answered from the precomputed table
+                    results = None
+                    if not personality_traits and name_style == "Any" and model == DEFAULT_MODEL:
+                        results = quick_pick(animal_type, pet_color, gender, num_suggestions, deterministic)
+
+                    if not results:
+                        generator = get_generator(temperature, deterministic, model)
+                        if num_suggestions > 1:
+                            results = generator.generate_many(
+                                animal_type, pet_color, gender, personality_traits, name_style,
+                                count=num_suggestions
+                            )
+                        else:
+                            placeholder = st.empty()
+                            results = [generator.generate_name(
+                                animal_type, pet_color, gender, personality_traits, name_style,
+                                on_partial=lambda partial: display_partial_name(placeholder, partial)
+                            )]
+                            placeholder.empty()
+
+                    for result in results:
+                        # Failed candidates are kept too so their error is shown
+                        if not result["name"]:
+                            st.session_state.last_results.append(result)
+                        else:
                             st.session_state.generation_count += 1
-                            
-                            result["timestamp"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+                            result["timestamp_ns"] = time.time_ns()
                             result["animal_type"] = animal_type
                             result["pet_color"] = pet_color
                             st.session_state.name_history.append(result)
+                            st.session_state.last_results.append(result)
 
-                            display_name_result(result, pet_color, animal_type, gender)
-
-                    except Exception as e:
-                        st.error(f"An error occurred: {str(e)}")
-            else:
-                st.warning("Please fill in the pet type, color, and gender!")
-
-    with tab2:
-        st.header("🖼️ Name Gallery")
-        display_favorites()
-        display_name_history()
-
-    with tab3:
-        display_tips()
-
+                except Exception as e:
+                    st.error(f"An error occurred: {str(e)}")
+
+            # History and counters changed, so refresh the gallery and footer too;
+            # the new names are shown from session state on the next run
+            if st.session_state.last_results:
+                st.rerun()
+        else:
+            st.warning("Please fill in the pet type, color, and gender!")
+
+    for index, result in enumerate(st.session_state.last_results):
+        if result["error"]:
+            st.warning(result["error"])
+        else:
+            display_name_result(result, result["pet_color"], result["animal_type"], result["gender"], key=index)
+
+def display_gallery(favorites):
+    st.header("🖼️ Name Gallery")
+    display_favorites(favorites)
+    display_name_history()
+
+def display_stats(favorites):
     st.markdown("---")
     col_stats1, col_stats2, col_stats3 = st.columns(3)
     with col_stats1:
         st.metric("Names Generated", st.session_state.generation_count)
     with col_stats2:
-        st.metric("Favorites Saved", len(load_favorites()))
+        st.metric("Favorites Saved", len(favorites))
     with col_stats3:
         st.metric("Names in History", len(st.session_state.name_history))
 
+def main():
+    setup_page_config()
+    initialize_session_state()
+
+    st.title("🐾 Perfect Pet Name Generator")
+    st.markdown("*Creating unique and meaningful names for your furry friends!*")
+
+    with st.sidebar.expander("⚙️ Advanced"):
+        model = st.selectbox(
+            "Model",
+            MODEL_OPTIONS,
+            help="Larger models may give better names but respond more slowly"
+        )
+
+    # Read once and shared by the gallery and the footer
+    favorites = load_favorites()
+
+    tab1, tab2, tab3 = st.tabs(["Generate Name", "Name Gallery", "Tips & Tricks"])
+
+    with tab1:
+        display_generator(model)
+
+    with tab2:
+        display_gallery(favorites)
+
+    with tab3:
+        display_tips()
+
+    display_stats(favorites)
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,39 @@
+import logging
+from itertools import product
+
+import orjson
+
+from main import GENDERS, PET_COLORS, PET_TYPES, PRECOMPUTED_PATH, PetNameGenerator, precomputed_key
+
+logger = logging.getLogger(__name__)
+
+# A spread of creativity levels gives quick picks some variety
+TEMPERATURES = (0.5, 0.7, 1.0)
+NAMES_PER_TEMPERATURE = 2
+
+# Requests in flight at once, kept well under typical OpenAI rate limits
+MAX_CONCURRENCY = 16
+
+def main():
+    table = {}
+    combos = [
+        (animal_type, pet_color, gender)
+        for animal_type, pet_color, gender in product(PET_TYPES, PET_COLORS, GENDERS)
+        if "Other" not in (animal_type, pet_color)
+    ]
+    pets = [combo for combo in combos for _ in range(NAMES_PER_TEMPERATURE)]
+
+    for temperature in TEMPERATURES:
+        generator = PetNameGenerator(temperature=temperature)
+        results = generator.generate_batch(pets, max_concurrency=MAX_CONCURRENCY)
+        for pet, result in zip(pets, results):
+            if result["name"]:
+                table.setdefault(precomputed_key(*pet), []).append(result)
+        logger.info(f"Generated names for {len(combos)} combinations at temperature {temperature}")
+
+    with open(PRECOMPUTED_PATH, "wb") as f:
+        f.write(orjson.dumps(table, option=orjson.OPT_INDENT_2))
+    logger.info(f"Wrote {len(table)} combinations to {PRECOMPUTED_PATH}")
+
+if __name__ == "__main__":
+    main()